@@ -0,0 +1,16 @@
+# helpers shared by the python tests
+import random
+
+# random test data, generated in a single call rather than byte by byte
+# (`Random.randbytes` needs python 3.9)
+# seeded per call, so the data does not depend on which tests ran before;
+# pass distinct seeds where distinct payloads are needed
+def randbytes(n, seed=0):
+    return random.Random(seed).getrandbits(n * 8).to_bytes(n, "little")
+
+# assert that every hash in `expect` is in `got`
+def hashes_exist(expect, got):
+    got_set = set(got)
+    missing = [str(h) for h in expect if h not in got_set]
+    if missing:
+        raise AssertionError(f"could not find {missing} in list")
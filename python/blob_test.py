@@ -1,50 +1,52 @@
 # tests that correspond to the `src/doc.rs` rust api
 import pytest
-import tempfile
-import random
-import os
+import logging
 import time
 
-from iroh import Hash, IrohNode, SetTagOption, BlobFormat, WrapOption, AddProgressType, NodeOptions
+from iroh import Hash, IrohNode, SetTagOption, BlobFormat, WrapOption, AddProgressType
 
-def test_hash():
-    hash_str = "2kbxxbofqx5rau77wzafrj4yntjb4gn4olfpwxmv26js6dvhgjhq"
-    hex_str = "d2837b85c585fb1053ffb64058a7986cd21e19bc72cafb5d95d7932f0ea7324f"
-    bytes = b'\xd2\x83\x7b\x85\xc5\x85\xfb\x10\x53\xff\xb6\x40\x58\xa7\x98\x6c\xd2\x1e\x19\xbc\x72\xca\xfb\x5d\x95\xd7\x93\x2f\x0e\xa7\x32\x4f'
-    #
-    # create hash from string
-    hash = Hash.from_string(hash_str)
-    #
-    # test methods are as expected
-    assert str(hash) == hash_str
-    assert hash.to_bytes() == bytes
-    assert hash.to_hex() == hex_str
+from _iroh_test_helpers import randbytes, hashes_exist
+
+log = logging.getLogger(__name__)
+
+# a known hash in each of its encodings
+HASH_STR = "2kbxxbofqx5rau77wzafrj4yntjb4gn4olfpwxmv26js6dvhgjhq"
+HASH_HEX = "d2837b85c585fb1053ffb64058a7986cd21e19bc72cafb5d95d7932f0ea7324f"
+HASH_BYTES = bytes.fromhex(HASH_HEX)
+CID_PREFIX = bytes.fromhex("01551e20")
+
+# the same checks for each way of constructing a hash
+@pytest.mark.parametrize("ctor,arg", [
+    (Hash.from_string, HASH_STR),
+    (Hash.from_bytes, HASH_BYTES),
+    (Hash.from_cid_bytes, CID_PREFIX + HASH_BYTES),
+], ids=["from_string", "from_bytes", "from_cid_bytes"])
+def test_hash(ctor, arg):
     #
-    # create hash from bytes
-    hash_0 = Hash.from_bytes(bytes)
+    # create hash
+    hash = ctor(arg)
     #
     # test methods are as expected
-    assert str(hash_0) == hash_str
-    assert hash_0.to_bytes() == bytes
-    assert hash_0.to_hex() == hex_str
+    assert str(hash) == HASH_STR
+    assert hash.to_bytes() == HASH_BYTES
+    assert hash.to_hex() == HASH_HEX
+    assert hash.as_cid_bytes() == CID_PREFIX + HASH_BYTES
     #
     # test that the eq function works
+    hash_0 = Hash.from_bytes(HASH_BYTES)
     assert hash.equal(hash_0)
-    assert hash_0.equal(hash)
+    assert hash == hash_0
+    assert hash in {hash_0}
 
 # test functionality between adding as bytes and reading to bytes
-def test_blob_add_get_bytes():
-    #
-    # create node
-    dir = tempfile.TemporaryDirectory()
-    node = IrohNode(dir.name)
+@pytest.mark.parametrize("blob_size", [100, 1 << 20])
+def test_blob_add_get_bytes(node, blob_size):
     #
     # create bytes
-    blob_size = 100
-    bytes = bytearray(map(random.getrandbits,(8,)*blob_size))
+    payload = randbytes(blob_size)
     #
     # add blob
-    add_outcome = node.blobs_add_bytes(bytes)
+    add_outcome = node.blobs_add_bytes(payload)
     #
     # check outcome info is as expected
     assert add_outcome.format == BlobFormat.RAW
@@ -58,47 +60,43 @@ def test_blob_add_get_bytes():
     # get bytes
     got_bytes = node.blobs_read_to_bytes(hash)
     assert len(got_bytes) == blob_size
-    assert got_bytes == bytes
+    assert got_bytes == payload
 
 # test functionality between reading bytes from a path and writing bytes to
 # a path
-def test_blob_read_write_path():
-    iroh_dir = tempfile.TemporaryDirectory()
-    node = IrohNode(iroh_dir.name)
+def test_blob_read_write_path(node, tmp_path):
     #
     # create bytes
     blob_size = 100
-    bytes = bytearray(map(random.getrandbits,(8,)*blob_size))
+    payload = randbytes(blob_size)
     #
     # write to file
-    dir = tempfile.TemporaryDirectory()
-    path = os.path.join(dir.name, "in")
-    file = open(path, "wb")
-    file.write(bytes)
-    file.close()
+    in_path = tmp_path / "in"
+    in_path.write_bytes(payload)
     #
     # add blob
     tag = SetTagOption.auto()
     wrap = WrapOption.no_wrap()
 
     class AddCallback:
-        hash = None
-        format = None
+        def __init__(self):
+            self.hash = None
+            self.format = None
 
-        def progress(x, progress_event):
-            print(progress_event.type())
-            if progress_event.type() == AddProgressType.ALL_DONE:
+        def progress(self, progress_event):
+            # a single call across the ffi for the event type
+            t = progress_event.type()
+            if t == AddProgressType.ALL_DONE:
                 all_done_event = progress_event.as_all_done()
-                x.hash = all_done_event.hash
-                print(all_done_event.hash)
-                print(all_done_event.format)
-                x.format = all_done_event.format
-            if progress_event.type() == AddProgressType.ABORT:
+                self.hash = all_done_event.hash
+                log.debug("all done: %s %s", all_done_event.hash, all_done_event.format)
+                self.format = all_done_event.format
+            elif t == AddProgressType.ABORT:
                 abort_event = progress_event.as_abort()
                 raise Exception(abort_event.error)
 
     cb = AddCallback()
-    node.blobs_add_from_path(path, False, tag, wrap, cb)
+    node.blobs_add_from_path(str(in_path), False, tag, wrap, cb)
     #
     # check outcome info is as expected
     assert cb.format == BlobFormat.RAW
@@ -110,142 +108,124 @@ def test_blob_read_write_path():
     #
     # get bytes
     got_bytes = node.blobs_read_to_bytes(cb.hash)
-    print("read_to_bytes {}", got_bytes)
+    log.debug("read_to_bytes %s", got_bytes)
     assert len(got_bytes) == blob_size
-    assert got_bytes == bytes
+    assert got_bytes == payload
     #
     # write to file
-    out_path = os.path.join(dir.name, "out")
-    node.blobs_write_to_path(cb.hash, out_path)
-    # open file
-    got_file = open(out_path, "rb")
-    got_bytes = got_file.read()
-    got_file.close()
-    print("write_to_path {}", got_bytes)
+    out_path = tmp_path / "out"
+    node.blobs_write_to_path(cb.hash, str(out_path))
+    got_bytes = out_path.read_bytes()
+    log.debug("write_to_path %s", got_bytes)
     assert len(got_bytes) == blob_size
-    assert got_bytes == bytes
+    assert got_bytes == payload
 
-def test_blob_collections():
-    collection_dir = tempfile.TemporaryDirectory()
+def test_blob_collections(tmp_path):
+    collection_dir = tmp_path / "collection"
+    collection_dir.mkdir()
     num_files = 3
     blob_size = 100
     for i in range(num_files):
-        path = os.path.join(collection_dir.name, str(i))
-        bytes = bytearray(map(random.getrandbits,(8,)*blob_size))
-        file = open(path, "wb")
-        file.write(bytes)
-        file.close()
-    print(collection_dir.__sizeof__())
+        (collection_dir / str(i)).write_bytes(randbytes(blob_size, seed=i))
 
-    # make node
-    iroh_dir = tempfile.TemporaryDirectory()
-    node = IrohNode(iroh_dir.name)
+    # make node, a node of its own since the test counts every blob in the
+    # store
+    node = IrohNode(str(tmp_path / "iroh"))
 
     # ensure zero blobs
-    blobs = node.blobs_list()
-    assert len(blobs) == 0
+    assert node.blobs_list_count() == 0
 
     # create callback to get blobs and collection hash
     class AddCallback:
-        collection_hash = None
-        format = None
-        blob_hashes = []
+        def __init__(self):
+            self.collection_hash = None
+            self.format = None
+            self.blob_hashes = set()
 
         def progress(self, progress_event):
-            print(progress_event.type())
-            if progress_event.type() == AddProgressType.ALL_DONE:
+            # a single call across the ffi for the event type
+            t = progress_event.type()
+            if t == AddProgressType.ALL_DONE:
                 all_done_event = progress_event.as_all_done()
                 self.collection_hash = all_done_event.hash
                 self.format = all_done_event.format
-            if progress_event.type() == AddProgressType.ABORT:
+            elif t == AddProgressType.ABORT:
                 abort_event = progress_event.as_abort()
                 raise Exception(abort_event.error)
-            if progress_event.type() == AddProgressType.DONE:
+            elif t == AddProgressType.DONE:
                 done_event = progress_event.as_done()
-                print(done_event.hash)
-                self.blob_hashes.append(done_event.hash)
+                log.debug("done: %s", done_event.hash)
+                self.blob_hashes.add(done_event.hash)
 
     cb = AddCallback()
     tag = SetTagOption.auto()
     wrap = WrapOption.no_wrap()
     # add from path
-    node.blobs_add_from_path(collection_dir.name, False, tag, wrap, cb)
+    node.blobs_add_from_path(str(collection_dir), False, tag, wrap, cb)
 
     assert cb.collection_hash != None
     assert cb.format == BlobFormat.HASH_SEQ
+    assert len(cb.blob_hashes) == num_files
 
     # list collections
     collections = node.blobs_list_collections()
-    print("collection hash ", collections[0].hash)
+    log.debug("collection hash %s", collections[0].hash)
     assert len(collections) == 1
-    assert collections[0].hash.equal(cb.collection_hash)
+    assert collections[0].hash == cb.collection_hash
     # should the blobs_count be 4?
     assert collections[0].total_blobs_count == 4
     # this always returns as None
     # assert collections[0].total_blobs_size == 300
 
     # list blobs
-    collection_hashes = cb.blob_hashes
-    collection_hashes.append(cb.collection_hash)
+    collection_hashes = cb.blob_hashes | {cb.collection_hash}
     got_hashes = node.blobs_list()
     for hash in got_hashes:
         blob = node.blobs_read_to_bytes(hash)
-        print("hash ", hash, " has size ", len(blob))
+        log.debug("hash %s has size %d", hash, len(blob))
+        if hash in cb.blob_hashes:
+            assert len(blob) == blob_size
 
     hashes_exist(collection_hashes, got_hashes)
     # collections also create a metadata hash that is not accounted for
     # in the list of hashes
     assert len(collection_hashes)+1 == len(got_hashes)
 
-def test_list_and_delete():
-    iroh_dir = tempfile.TemporaryDirectory()
-    opts = NodeOptions(gc_interval_millis=100)
-    node = IrohNode.with_options(iroh_dir.name, opts)
+def test_list_and_delete(gc_node):
+    node = gc_node
     #
     # create bytes
     blob_size = 100
-    blobs = []
     num_blobs = 3;
+    blobs = [randbytes(blob_size, seed=i) for i in range(num_blobs)]
 
-    for x in range(num_blobs):
-        print(x)
-        bytes = bytearray(map(random.getrandbits,(8,)*blob_size))
-        blobs.append(bytes)
-
-    hashes = []
-    tags = []
-    for blob in blobs:
-        output = node.blobs_add_bytes(blob)
-        hashes.append(output.hash)
-        tags.append(output.tag)
+    outputs = [node.blobs_add_bytes(blob) for blob in blobs]
+    hashes = [output.hash for output in outputs]
+    tags = [output.tag for output in outputs]
 
     got_hashes = node.blobs_list()
     assert len(got_hashes) == num_blobs
     hashes_exist(hashes, got_hashes)
+    #
+    # the packed list holds the same hashes, 32 bytes each
+    got_bytes = node.blobs_list_bytes()
+    assert len(got_bytes) == 32 * num_blobs
+    assert {got_bytes[i:i+32] for i in range(0, len(got_bytes), 32)} == {h.to_bytes() for h in hashes}
 
     remove_hash = hashes.pop(0)
     remove_tag = tags.pop(0)
     # delete the tag for the first blob
     node.tags_delete(remove_tag)
-    # wait for GC to clear the blob
-    time.sleep(0.25)
+    # wait for GC to clear the blob, polling rather than sleeping for the
+    # worst case
+    deadline = time.monotonic() + 5
+    while node.blobs_list_count() != num_blobs - 1:
+        assert time.monotonic() < deadline, "blob {} should have been removed".format(remove_hash)
+        time.sleep(0.05)
 
     got_hashes = node.blobs_list();
-    assert len(got_hashes) == num_blobs - 1
     hashes_exist(hashes, got_hashes)
-
-    for hash in got_hashes:
-        if remove_hash.equal(hash):
-            raise Exception("blob {} should have been removed", remove_hash)
-
-def hashes_exist(expect, got):
-    for hash in expect:
-        exists = False
-        for h in got:
-            if h.equal(hash):
-                exists = True
-        if not exists:
-            raise Exception("could not find ", hash, "in list")
+    assert remove_hash not in set(got_hashes), "blob {} should have been removed".format(remove_hash)
 
 # def test_download():
     # need to wait to refactor IrohNode to take an rpc port, or we remove rpc
@@ -0,0 +1,45 @@
+# shared fixtures for the python tests
+import pytest
+
+from iroh import IrohNode, NodeOptions
+
+# a single node for the whole test session, starting a node (runtime, blob
+# store, docs store) dominates the run time of most tests
+@pytest.fixture(scope="session")
+def iroh_node(tmp_path_factory):
+    return IrohNode(str(tmp_path_factory.mktemp("iroh")))
+
+# the shared node, cleaned up after each test: docs and authors created by the
+# test are dropped, and so are blobs that are held by a tag.
+# untagged blobs (collection children and metadata, doc content) cannot be
+# deleted through the api and stay on the node, so a test that counts the
+# blobs in the store needs a node of its own
+@pytest.fixture
+def node(iroh_node):
+    docs = {doc.namespace for doc in iroh_node.doc_list()}
+    authors = set(iroh_node.author_list())
+    yield iroh_node
+    #
+    # drop any docs created during the test, along with their entries
+    for doc in iroh_node.doc_list():
+        if doc.namespace not in docs:
+            iroh_node.doc_drop(doc.namespace)
+    #
+    # remove the tagged blobs, `blobs_delete_blob` skips untagged ones
+    for hash in iroh_node.blobs_list():
+        iroh_node.blobs_delete_blob(hash)
+    #
+    # remove any authors created during the test
+    for author in iroh_node.author_list():
+        if author not in authors:
+            iroh_node.author_delete(author)
+
+# a node of its own with garbage collection enabled, for tests that need to
+# observe blobs being collected.
+# the node owns its runtime and shuts down when pytest releases it at teardown;
+# pytest keeps `tmp_path` until the session is over, so the store is never
+# removed from under a running node
+@pytest.fixture
+def gc_node(tmp_path):
+    opts = NodeOptions(gc_interval_millis=100)
+    return IrohNode.with_options(str(tmp_path / "iroh"), opts)
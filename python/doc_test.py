@@ -1,15 +1,17 @@
 # tests that correspond to the `src/doc.rs` rust api
-from iroh import IrohNode, PublicKey, NodeAddr, iroh, AuthorId, Query, SortBy, SortDirection, QueryOptions, path_to_key, key_to_path
+from iroh import PublicKey, NodeAddr, iroh, AuthorId, Query, SortBy, SortDirection, QueryOptions, path_to_key, key_to_path
 import pytest
-import tempfile
-import os
-import random
+from pathlib import Path
+
+from _iroh_test_helpers import randbytes
+
+# identities shared by the tests, parsed once; they are immutable
+KEY_STR = "ki6htfv2252cj2lhq3hxu4qfcfjtpjnukzonevigudzjpmmruxva"
+NODE_ID = PublicKey.from_string(KEY_STR)
+AUTHOR_STR = "mqtlzayyv4pb4xvnqnw5wxb2meivzq5ze6jihpa7fv5lfwdoya4q"
+AUTHOR_ID = AuthorId.from_string(AUTHOR_STR)
 
 def test_node_addr():
-    #
-    # create a node_id
-    key_str = "ki6htfv2252cj2lhq3hxu4qfcfjtpjnukzonevigudzjpmmruxva"
-    node_id = PublicKey.from_string(key_str)
     #
     # create socketaddrs
     ipv4 = "127.0.0.1:3000"
@@ -20,7 +22,7 @@ def test_node_addr():
     #
     # create a NodeAddr
     expect_addrs = [ipv4, ipv6]
-    node_addr = NodeAddr(node_id, relay_url, expect_addrs)
+    node_addr = NodeAddr(NODE_ID, relay_url, expect_addrs)
     #
     # test we have returned the expected addresses
     got_addrs = node_addr.direct_addresses()
@@ -31,67 +33,31 @@ def test_node_addr():
 
 def test_author_id():
     #
-    # create id from string
-    author_str = "mqtlzayyv4pb4xvnqnw5wxb2meivzq5ze6jihpa7fv5lfwdoya4q"
-    author = AuthorId.from_string(author_str)
-    #
-    # call to_string, ensure equal
-    assert str(author) == author_str
+    # call to_string on the id from string, ensure equal
+    assert str(AUTHOR_ID) == AUTHOR_STR
     #
     # create another id, same string
-    author_0 = AuthorId.from_string(author_str)
+    author_0 = AuthorId.from_string(AUTHOR_STR)
     #
     # ensure equal
-    assert author.equal(author_0)
-    assert author_0.equal(author)
-
-def test_query():
-    opts = QueryOptions(sort_by=SortBy.KEY_AUTHOR, direction=SortDirection.ASC, offset=10, limit=10)
-    # all
-    all = Query.all(opts)
-    assert 10 == all.offset()
-    assert 10 == all.limit()
+    assert AUTHOR_ID.equal(author_0)
 
-    # single_latest_per_key
-    opts.direction = SortDirection.DESC
-    opts.limit = 0
-    opts.offset = 0
-    single_latest_per_key = Query.single_latest_per_key(opts)
-    assert 0 == single_latest_per_key.offset()
-    assert None == single_latest_per_key.limit()
+def query_opts(direction, offset, limit):
+    return QueryOptions(sort_by=SortBy.KEY_AUTHOR, direction=direction, offset=offset, limit=limit)
 
-    # author
-    opts.direction = SortDirection.ASC
-    opts.offset = 100
-    author = Query.author(AuthorId.from_string("mqtlzayyv4pb4xvnqnw5wxb2meivzq5ze6jihpa7fv5lfwdoya4q"), opts)
-    assert 100 == author.offset()
-    assert None == author.limit()
+# each case builds its query from fresh options, a limit of 0 means no limit
+@pytest.mark.parametrize("factory,expected_offset,expected_limit", [
+    (lambda: Query.all(query_opts(SortDirection.ASC, 10, 10)), 10, 10),
+    (lambda: Query.single_latest_per_key(query_opts(SortDirection.DESC, 0, 0)), 0, None),
+    (lambda: Query.author(AUTHOR_ID, query_opts(SortDirection.ASC, 100, 0)), 100, None),
+    (lambda: Query.key_exact(b'key', query_opts(SortDirection.DESC, 0, 100)), 0, 100),
+    (lambda: Query.key_prefix(b'prefix', query_opts(SortDirection.DESC, 0, 100)), 0, 100),
+], ids=["all", "single_latest_per_key", "author", "key_exact", "key_prefix"])
+def test_query(factory, expected_offset, expected_limit):
+    query = factory()
+    assert (query.offset(), query.limit()) == (expected_offset, expected_limit)
 
-    # key_exact
-    opts.sort_by = SortBy.KEY_AUTHOR
-    opts.direction = SortDirection.DESC
-    opts.offset = 0
-    opts.limit = 100
-    key_exact = Query.key_exact(
-        b'key',
-        opts
-    )
-    assert 0 == key_exact.offset()
-    assert 100 == key_exact.limit()
-
-    # key_prefix
-    key_prefix = Query.key_prefix(
-        b'prefix',
-        opts
-    );
-    assert 0 == key_prefix.offset()
-    assert 100 == key_prefix.limit()
-
-def test_doc_entry_basics():
-    #
-    # create node
-    dir = tempfile.TemporaryDirectory()
-    node = IrohNode(dir.name)
+def test_doc_entry_basics(node):
     #
     # create doc and author
     doc = node.doc_create()
@@ -110,47 +76,38 @@ def test_doc_entry_basics():
     got_val = entry.content_bytes(doc)
     assert val == got_val
 
-def test_doc_import_export():
+def test_doc_import_export(node, tmp_path):
     #
-    # create file temp der
-    dir = tempfile.TemporaryDirectory()
-    in_root = os.path.join(dir.name, "in")
-    out_root = os.path.join(dir.name, "out")
-    os.makedirs(in_root, exist_ok=True)
-    os.makedirs(out_root, exist_ok=True)
+    # create file temp dirs
+    in_root = tmp_path / "in"
+    out_root = tmp_path / "out"
+    in_root.mkdir()
+    out_root.mkdir()
     #
     # create file
-    path = os.path.join(in_root, "test")
+    in_path = in_root / "test"
     size = 100
-    bytes = bytearray(map(random.getrandbits,(8,)*size))
-    file = open(path, "wb")
-    file.write(bytes)
-    file.close()
-    #
-    # create node
-    iroh_dir = tempfile.TemporaryDirectory()
-    node = IrohNode(iroh_dir.name)
+    payload = randbytes(size)
+    in_path.write_bytes(payload)
     #
     # create doc and author
     doc = node.doc_create()
     author = node.author_create()
     #
     # import entry
-    key = path_to_key(path, None, in_root)
-    doc.import_file(author, key, path, True, None)
+    key = path_to_key(str(in_path), None, str(in_root))
+    doc.import_file(author, key, str(in_path), True, None)
     #
     # get entry
     query = Query.author_key_exact(author, key)
     entry = doc.get_one(query)
     #
     # export entry
-    path = key_to_path(key, None, out_root)
-    doc.export_file(entry, path, None)
+    out_path = key_to_path(key, None, str(out_root))
+    doc.export_file(entry, out_path, None)
     #
     # read file
-    file = open(path, "rb")
-    got_bytes = file.read()
-    file.close()
+    got_bytes = Path(out_path).read_bytes()
     #
     #
-    assert bytes == got_bytes
+    assert payload == got_bytes
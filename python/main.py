@@ -2,15 +2,29 @@ import iroh
 
 import argparse
 import os
-import time
+import sys
+import threading
 
 IROH_DATA_DIR = "./iroh-data"
+# default for how long to wait for the joined doc to sync and download its content
+SYNC_TIMEOUT_SECS = 30
+
+# signals once the content found by the first sync has been downloaded, the
+# live events are called on a thread owned by the node
+class SubscribeCallback:
+    def __init__(self):
+        self.content_ready = threading.Event()
+
+    def event(self, event):
+        if event.type() == iroh.LiveEventType.PENDING_CONTENT_READY:
+            self.content_ready.set()
 
 if __name__ == "__main__":
 
     # parse arguments
     parser = argparse.ArgumentParser(description='Python Iroh Node Demo')
     parser.add_argument('--ticket', type=str, help='ticket to join a document')
+    parser.add_argument('--timeout', type=float, default=SYNC_TIMEOUT_SECS, help='seconds to wait for the document content to be ready')
 
     args = parser.parse_args()
 
@@ -22,8 +36,7 @@ if __name__ == "__main__":
         print("creating data directory at ./iroh-data")
 
         # create iroh data dir if it does not exists
-        if not os.path.exists(IROH_DATA_DIR):
-            os.mkdir(IROH_DATA_DIR)
+        os.makedirs(IROH_DATA_DIR, exist_ok=True)
 
         # create iroh node
         node = iroh.IrohNode(IROH_DATA_DIR)
@@ -45,24 +58,29 @@ if __name__ == "__main__":
         exit()
 
     # create iroh data dir if it does not exists
-    if not os.path.exists(IROH_DATA_DIR):
-        os.mkdir(IROH_DATA_DIR)
+    os.makedirs(IROH_DATA_DIR, exist_ok=True)
 
     # create iroh node
     node = iroh.IrohNode(IROH_DATA_DIR)
     print("Started Iroh node: {}".format(node.node_id()))
 
-    # join doc
-    doc = node.doc_join(args.ticket)
+    # join doc, subscribing before the sync starts so no event is missed
+    cb = SubscribeCallback()
+    doc = node.doc_join_and_subscribe(args.ticket, cb)
     print("Joined doc: {}".format(doc.id()))
 
-    # sync & print
-    print("Waiting 5 seconds to let stuff sync...")
-    time.sleep(5)
-    keys = doc.keys()
+    # sync & print, content downloads only start once the sync has finished,
+    # so wait for those too
+    print("Waiting for the sync to finish...")
+    if not cb.content_ready.wait(timeout=args.timeout):
+        print("No content ready within {} seconds (peer unreachable or sync still in progress)".format(args.timeout))
+        sys.exit(1)
+
+    # fetch the latest entry for every key in a single call
+    entries = doc.get_many(iroh.Query.single_latest_per_key(None))
     print("Data:")
-    for key in keys:
-        content = doc.get_content_bytes(key)
-        print("{} : {} (hash: {})".format(key.key(), content.decode("utf8"), key.hash().to_string()))
+    for entry in entries:
+        content = entry.content_bytes(doc)
+        print("{} : {} (hash: {})".format(entry.key(), content.decode("utf8"), entry.content_hash()))
     
     
@@ -1,36 +1,38 @@
 # tests that correspond to the `src/doc.rs` rust api
-import tempfile
-import queue
+import logging
 import time
+from concurrent.futures import Future
 
 from iroh import IrohNode, ShareMode, LiveEventType, AddrInfoOptions
 
-def test_basic_sync():
+log = logging.getLogger(__name__)
+
+def test_basic_sync(tmp_path):
     # Create node_0
-    iroh_dir_0 = tempfile.TemporaryDirectory()
-    node_0 = IrohNode(iroh_dir_0.name)
+    node_0 = IrohNode(str(tmp_path / "node_0"))
 
     # Create node_1
-    iroh_dir_1 = tempfile.TemporaryDirectory()
-    node_1 = IrohNode(iroh_dir_1.name)
+    node_1 = IrohNode(str(tmp_path / "node_1"))
 
     # Create doc on node_0
     doc_0 = node_0.doc_create()
     ticket = doc_0.share(ShareMode.WRITE, AddrInfoOptions.RELAY_AND_ADDRESSES)
 
     class SubscribeCallback:
-        def __init__(self, found_s):
-            self.found_s = found_s
+        def __init__(self, found):
+            self.found = found
 
         def event(self, event):
-            print("", event.type())
-            if (event.type() == LiveEventType.CONTENT_READY):
-                print("got event type content ready")
-                self.found_s.put(event.as_content_ready())
-
-    # Subscribe to sync events
-    found_s = queue.Queue()
-    cb = SubscribeCallback(found_s)
+            event_type = event.type()
+            log.debug("event %s", event_type)
+            if (event_type == LiveEventType.CONTENT_READY and not self.found.done()):
+                log.debug("got event type content ready")
+                self.found.set_result(event.as_content_ready())
+
+    # Subscribe to sync events, resolving the future with the first content
+    # ready event
+    found = Future()
+    cb = SubscribeCallback(found)
     doc_0.subscribe(cb)
 
     # Join the same doc from node_1
@@ -41,7 +43,7 @@ def test_basic_sync():
     doc_1.set_bytes(author, b"hello", b"world")
 
     # Wait for the content ready event
-    hash = found_s.get()
+    hash = found.result()
     
     # Get content from hash
     val = node_1.blobs_read_to_bytes(hash)
@@ -5,7 +5,7 @@ use futures::TryStreamExt;
 use crate::{block_on, IrohError, IrohNode};
 
 /// Identifier for an [`Author`]
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Hash)]
 pub struct AuthorId(pub(crate) iroh::docs::AuthorId);
 
 impl std::fmt::Display for AuthorId {
@@ -60,7 +60,7 @@ impl IrohNode {
     ///
     /// If you need only a single author, use [`Self::default`].
     pub fn author_create(&self) -> Result<Arc<AuthorId>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let author = self.sync_client.authors().create().await?;
 
             Ok(Arc::new(AuthorId(author)))
@@ -74,7 +74,7 @@ impl IrohNode {
     ///
     /// The default author can be set with [`Self::set_default`].
     pub fn author_default(&self) -> Result<Arc<AuthorId>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let author = self.sync_client.authors().default().await?;
             Ok(Arc::new(AuthorId(author)))
         })
@@ -82,7 +82,7 @@ impl IrohNode {
 
     /// List all the AuthorIds that exist on this node.
     pub fn author_list(&self) -> Result<Vec<Arc<AuthorId>>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let authors = self
                 .sync_client
                 .authors()
@@ -95,11 +95,27 @@ impl IrohNode {
         })
     }
 
+    /// Count the AuthorIds that exist on this node.
+    ///
+    /// Unlike [`Self::author_list`], this does not allocate an [`AuthorId`] for each author.
+    pub fn author_list_count(&self) -> Result<u64, IrohError> {
+        block_on(self.rt(), async {
+            let count = self
+                .sync_client
+                .authors()
+                .list()
+                .await?
+                .try_fold(0, |count, _| futures::future::ok(count + 1))
+                .await?;
+            Ok(count)
+        })
+    }
+
     /// Export the given author.
     ///
     /// Warning: This contains sensitive data.
     pub fn author_export(&self, author: Arc<AuthorId>) -> Result<Arc<Author>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let author = self.sync_client.authors().export(author.0).await?;
             match author {
                 Some(author) => Ok(Arc::new(Author(author))),
@@ -112,7 +128,7 @@ impl IrohNode {
     ///
     /// Warning: This contains sensitive data.
     pub fn author_import(&self, author: Arc<Author>) -> Result<Arc<AuthorId>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             self.sync_client.authors().import(author.0.clone()).await?;
             Ok(Arc::new(AuthorId(author.0.id())))
         })
@@ -122,7 +138,7 @@ impl IrohNode {
     ///
     /// Warning: This permanently removes this author.
     pub fn author_delete(&self, author: Arc<AuthorId>) -> Result<(), IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             self.sync_client.authors().delete(author.0).await?;
             Ok(())
         })
@@ -139,6 +155,7 @@ mod tests {
         let author_id = node.author_create().unwrap();
         let authors = node.author_list().unwrap();
         assert_eq!(authors.len(), 2);
+        assert_eq!(node.author_list_count().unwrap(), 2);
         let author = node.author_export(author_id.clone()).unwrap();
         assert!(author_id.equal(&author.id()));
         node.author_delete(author_id).unwrap();
@@ -18,7 +18,7 @@ impl IrohNode {
     /// Note: this allocates for each `BlobListResponse`, if you have many `BlobListReponse`s this may be a prohibitively large list.
     /// Please file an [issue](https://github.com/n0-computer/iroh-ffi/issues/new) if you run into this issue
     pub fn blobs_list(&self) -> Result<Vec<Arc<Hash>>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let response = self.sync_client.blobs().list().await?;
 
             let hashes: Vec<Arc<Hash>> = response
@@ -30,11 +30,42 @@ impl IrohNode {
         })
     }
 
+    /// Count all complete blobs.
+    ///
+    /// Unlike [`Self::blobs_list`], this does not allocate a [`Hash`] for each blob.
+    pub fn blobs_list_count(&self) -> Result<u64, IrohError> {
+        block_on(self.rt(), async {
+            let response = self.sync_client.blobs().list().await?;
+
+            let count = response
+                .try_fold(0, |count, _| futures::future::ok(count + 1))
+                .await?;
+
+            Ok(count)
+        })
+    }
+
+    /// List the hashes of all complete blobs as a single byte array, 32 bytes per hash.
+    pub fn blobs_list_bytes(&self) -> Result<Vec<u8>, IrohError> {
+        block_on(self.rt(), async {
+            let response = self.sync_client.blobs().list().await?;
+
+            let bytes = response
+                .try_fold(Vec::new(), |mut bytes, i| {
+                    bytes.extend_from_slice(i.hash.as_bytes());
+                    futures::future::ok(bytes)
+                })
+                .await?;
+
+            Ok(bytes)
+        })
+    }
+
     /// Get the size information on a single blob.
     ///
     /// Method only exists in FFI
     pub fn blobs_size(&self, hash: &Hash) -> Result<u64, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let r = self.sync_client.blobs().read(hash.0).await?;
             Ok(r.size())
         })
@@ -46,13 +77,13 @@ impl IrohNode {
     /// reading is small. If not sure, use [`Self::blobs_size`] and check the size with
     /// before calling [`Self::blobs_read_to_bytes`].
     pub fn blobs_read_to_bytes(&self, hash: Arc<Hash>) -> Result<Vec<u8>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let res = self
                 .sync_client
                 .blobs()
                 .read_to_bytes(hash.0)
                 .await
-                .map(|b| b.to_vec())?;
+                .map(Vec::from)?;
             Ok(res)
         })
     }
@@ -72,13 +103,13 @@ impl IrohNode {
             None => None,
             Some(l) => Some(usize::try_from(l).map_err(anyhow::Error::from)?),
         };
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let res = self
                 .sync_client
                 .blobs()
                 .read_at_to_bytes(hash.0, offset, len)
                 .await
-                .map(|b| b.to_vec())?;
+                .map(Vec::from)?;
             Ok(res)
         })
     }
@@ -97,7 +128,7 @@ impl IrohNode {
         wrap: Arc<WrapOption>,
         cb: Arc<dyn AddCallback>,
     ) -> Result<(), IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let mut stream = self
                 .sync_client
                 .blobs()
@@ -117,29 +148,22 @@ impl IrohNode {
     }
 
     /// Export the blob contents to a file path
-    /// The `path` field is expected to be the absolute path.
+    /// A relative `path` is resolved against the current working directory.
     pub fn blobs_write_to_path(&self, hash: Arc<Hash>, path: String) -> Result<(), IrohError> {
-        block_on(&self.rt(), async {
-            let mut reader = self.sync_client.blobs().read(hash.0).await?;
-            let path: PathBuf = path.into();
-            if let Some(dir) = path.parent() {
-                tokio::fs::create_dir_all(dir)
-                    .await
-                    .map_err(anyhow::Error::from)?;
-            }
-            let mut file = tokio::fs::File::create(path)
-                .await
-                .map_err(anyhow::Error::from)?;
-            tokio::io::copy(&mut reader, &mut file)
-                .await
-                .map_err(anyhow::Error::from)?;
-            Ok(())
-        })
+        let mut path = PathBuf::from(path);
+        if path.is_relative() {
+            path = std::env::current_dir()
+                .map_err(anyhow::Error::from)?
+                .join(path);
+        }
+        // Let the store copy its data file to the destination, rather than streaming the
+        // blob through a reader and a user space buffer.
+        self.export_inner(hash, path, BlobExportFormat::Blob, BlobExportMode::Copy)
     }
 
     /// Write a blob by passing bytes.
     pub fn blobs_add_bytes(&self, bytes: Vec<u8>) -> Result<BlobAddOutcome, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let res = self.sync_client.blobs().add_bytes(bytes).await?;
             Ok(res.into())
         })
@@ -152,7 +176,7 @@ impl IrohNode {
         opts: Arc<BlobDownloadOptions>,
         cb: Arc<dyn DownloadCallback>,
     ) -> Result<(), IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let mut stream = self
                 .sync_client
                 .blobs()
@@ -182,8 +206,19 @@ impl IrohNode {
         format: BlobExportFormat,
         mode: BlobExportMode,
     ) -> Result<(), IrohError> {
-        block_on(&self.rt(), async {
-            let destination: PathBuf = destination.into();
+        self.export_inner(hash, destination.into(), format, mode)
+    }
+
+    /// Shared body of [`Self::blobs_export`] and [`Self::blobs_write_to_path`], taking the
+    /// destination as a path so callers that already have one need not convert it to a string.
+    fn export_inner(
+        &self,
+        hash: Arc<Hash>,
+        destination: PathBuf,
+        format: BlobExportFormat,
+        mode: BlobExportMode,
+    ) -> Result<(), IrohError> {
+        block_on(self.rt(), async {
             if let Some(dir) = destination.parent() {
                 tokio::fs::create_dir_all(dir)
                     .await
@@ -209,7 +244,7 @@ impl IrohNode {
         blob_format: BlobFormat,
         ticket_options: AddrInfoOptions,
     ) -> Result<String, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let ticket = self
                 .sync_client
                 .blobs()
@@ -224,7 +259,7 @@ impl IrohNode {
     /// Note: this allocates for each `BlobListIncompleteResponse`, if you have many `BlobListIncompleteResponse`s this may be a prohibitively large list.
     /// Please file an [issue](https://github.com/n0-computer/iroh-ffi/issues/new) if you run into this issue
     pub fn blobs_list_incomplete(&self) -> Result<Vec<IncompleteBlobInfo>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let blobs = self
                 .sync_client
                 .blobs()
@@ -242,7 +277,7 @@ impl IrohNode {
     /// Note: this allocates for each `BlobListCollectionsResponse`, if you have many `BlobListCollectionsResponse`s this may be a prohibitively large list.
     /// Please file an [issue](https://github.com/n0-computer/iroh-ffi/issues/new) if you run into this issue
     pub fn blobs_list_collections(&self) -> Result<Vec<CollectionInfo>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let blobs = self
                 .sync_client
                 .blobs()
@@ -256,7 +291,7 @@ impl IrohNode {
 
     /// Read the content of a collection
     pub fn blobs_get_collection(&self, hash: Arc<Hash>) -> Result<Arc<Collection>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let collection = self.sync_client.blobs().get_collection(hash.0).await?;
 
             Ok(Arc::new(collection.into()))
@@ -273,7 +308,7 @@ impl IrohNode {
         tag: Arc<SetTagOption>,
         tags_to_delete: Vec<String>,
     ) -> Result<HashAndTag, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let collection = collection.0.read().unwrap().clone();
             let (hash, tag) = self
                 .sync_client
@@ -290,14 +325,14 @@ impl IrohNode {
 
             Ok(HashAndTag {
                 hash: Arc::new(hash.into()),
-                tag: tag.0.to_vec(),
+                tag: Vec::from(tag.0),
             })
         })
     }
 
     /// Delete a blob.
     pub fn blobs_delete_blob(&self, hash: Arc<Hash>) -> Result<(), IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let mut tags = self.sync_client.tags().list().await?;
 
             let mut name = None;
@@ -349,7 +384,7 @@ impl From<iroh::client::blobs::AddOutcome> for BlobAddOutcome {
             hash: Arc::new(value.hash.into()),
             format: value.format.into(),
             size: value.size,
-            tag: value.tag.0.to_vec(),
+            tag: Vec::from(value.tag.0),
         }
     }
 }
@@ -419,8 +454,11 @@ impl From<WrapOption> for iroh::client::blobs::WrapOption {
     }
 }
 
+/// The CIDv1 prefix of a raw blake3 hash: version 1, `raw` codec, `blake3` multihash, 32 byte digest.
+const CID_PREFIX: [u8; 4] = [0x01, 0x55, 0x1e, 0x20];
+
 /// Hash type used throughout Iroh. A blake3 hash.
-#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
+#[derive(Debug, Clone, PartialEq, Eq, Hash, Serialize, Deserialize)]
 pub struct Hash(pub(crate) iroh::blobs::Hash);
 
 impl From<iroh::blobs::Hash> for Hash {
@@ -448,6 +486,25 @@ impl Hash {
         Ok(Hash(iroh::blobs::Hash::from_bytes(bytes)))
     }
 
+    /// Bytes of the hash as a CID: the CIDv1 prefix followed by the raw hash bytes.
+    pub fn as_cid_bytes(&self) -> Vec<u8> {
+        let mut cid = [0u8; CID_PREFIX.len() + 32];
+        cid[..CID_PREFIX.len()].copy_from_slice(&CID_PREFIX);
+        cid[CID_PREFIX.len()..].copy_from_slice(self.0.as_bytes());
+        cid.to_vec()
+    }
+
+    /// Create a `Hash` from its CID bytes representation.
+    pub fn from_cid_bytes(bytes: Vec<u8>) -> Result<Self, IrohError> {
+        let hash = bytes
+            .strip_prefix(&CID_PREFIX[..])
+            .ok_or_else(|| anyhow::anyhow!("invalid cid prefix, expected a raw blake3 cid"))?;
+        let hash: [u8; 32] = hash.try_into().map_err(|_| {
+            anyhow::anyhow!("expected cid byte array of length 36, got {}", bytes.len())
+        })?;
+        Ok(Hash(iroh::blobs::Hash::from_bytes(hash)))
+    }
+
     /// Make a Hash from hex string
     pub fn from_string(s: String) -> Result<Self, IrohError> {
         let key = iroh::blobs::Hash::from_str(&s).map_err(anyhow::Error::from)?;
@@ -583,7 +640,7 @@ impl From<iroh::blobs::provider::AddProgress> for AddProgress {
                 AddProgress::AllDone(AddProgressAllDone {
                     hash: Arc::new(hash.into()),
                     format: format.into(),
-                    tag: tag.0.to_vec(),
+                    tag: Vec::from(tag.0),
                 })
             }
             iroh::blobs::provider::AddProgress::Abort(err) => {
@@ -1101,7 +1158,7 @@ pub struct CollectionInfo {
 impl From<iroh::client::blobs::CollectionInfo> for CollectionInfo {
     fn from(value: iroh::client::blobs::CollectionInfo) -> Self {
         CollectionInfo {
-            tag: value.tag.0.to_vec(),
+            tag: Vec::from(value.tag.0),
             hash: Arc::new(value.hash.into()),
             total_blobs_count: value.total_blobs_count,
             total_blobs_size: value.total_blobs_size,
@@ -1215,6 +1272,7 @@ mod tests {
         let hash_str = "6vp273v6cqbbq7xesa2xfrdt3oajykgeifprn3pj4p6y76654amq";
         let hex_str = "f55fafeebe1402187ee4903572c473db809c28c4415f16ede9e3fd8ffbdde019";
         let bytes = b"\xf5\x5f\xaf\xee\xbe\x14\x02\x18\x7e\xe4\x90\x35\x72\xc4\x73\xdb\x80\x9c\x28\xc4\x41\x5f\x16\xed\xe9\xe3\xfd\x8f\xfb\xdd\xe0\x19".to_vec();
+        let cid_bytes = [&CID_PREFIX[..], &bytes[..]].concat();
 
         // create hash from string
         let hash = Hash::from_string(hash_str.into()).unwrap();
@@ -1232,9 +1290,23 @@ mod tests {
         assert_eq!(bytes, hash_0.to_bytes());
         assert_eq!(hex_str.to_string(), hash_0.to_hex());
 
+        // create hash from cid bytes
+        let hash_1 = Hash::from_cid_bytes(cid_bytes.clone()).unwrap();
+
+        // test methods are as expected
+        assert_eq!(hash_str.to_string(), hash_1.to_string());
+        assert_eq!(bytes, hash_1.to_bytes());
+        assert_eq!(cid_bytes, hash_1.as_cid_bytes());
+        assert!(Hash::from_cid_bytes(bytes.clone()).is_err());
+
+        // invalid strings are rejected
+        assert!(Hash::from_string(hash_str[1..].into()).is_err());
+        assert!(Hash::from_string(hex_str.replace('f', "x")).is_err());
+
         // test that the eq function works
         assert!(hash.equal(&hash_0));
         assert!(hash_0.equal(&hash));
+        assert!(hash.equal(&hash_1));
     }
 
     #[test]
@@ -1494,13 +1566,28 @@ mod tests {
         let got_hashes = node.blobs_list().unwrap();
         assert_eq!(num_blobs, got_hashes.len());
         hashes_exist(&hashes, &got_hashes);
+        assert_eq!(num_blobs as u64, node.blobs_list_count().unwrap());
+        let got_bytes = node.blobs_list_bytes().unwrap();
+        assert_eq!(num_blobs * 32, got_bytes.len());
+        for hash in &hashes {
+            assert!(got_bytes.chunks(32).any(|b| b == hash.to_bytes()));
+        }
 
         let remove_hash = hashes.pop().unwrap();
         let remove_tag = tags.pop().unwrap();
         // delete the tag for the first blob
         node.tags_delete(remove_tag).unwrap();
-        // wait for GC to clear the blob. windows test runner is slow & needs like 500ms
-        std::thread::sleep(Duration::from_millis(500));
+        // wait for GC to clear the blob. poll instead of sleeping for the worst case, the
+        // windows test runner is slow & can need 500ms or more
+        let deadline = std::time::Instant::now() + Duration::from_secs(5);
+        while node.blobs_list_count().unwrap() != num_blobs as u64 - 1 {
+            assert!(
+                std::time::Instant::now() < deadline,
+                "blob {} should have been removed",
+                remove_hash
+            );
+            std::thread::sleep(Duration::from_millis(50));
+        }
 
         let got_hashes = node.blobs_list().unwrap();
         assert_eq!(num_blobs - 1, got_hashes.len());
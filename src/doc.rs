@@ -30,7 +30,7 @@ impl From<iroh::docs::CapabilityKind> for CapabilityKind {
 impl IrohNode {
     /// Create a new doc.
     pub fn doc_create(&self) -> Result<Arc<Doc>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let doc = self.sync_client.docs().create().await?;
 
             Ok(Arc::new(Doc {
@@ -42,7 +42,7 @@ impl IrohNode {
 
     /// Join and sync with an already existing document.
     pub fn doc_join(&self, ticket: String) -> Result<Arc<Doc>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let ticket = iroh::docs::DocTicket::from_str(&ticket).map_err(anyhow::Error::from)?;
             let doc = self.sync_client.docs().import(ticket).await?;
             Ok(Arc::new(Doc {
@@ -58,7 +58,7 @@ impl IrohNode {
         ticket: String,
         cb: Arc<dyn SubscribeCallback>,
     ) -> Result<Arc<Doc>, IrohError> {
-        let (doc, mut stream) = block_on(&self.rt(), async {
+        let (doc, mut stream) = block_on(self.rt(), async {
             let ticket = iroh::docs::DocTicket::from_str(&ticket)?;
             self.sync_client.docs().import_and_subscribe(ticket).await
         })?;
@@ -86,7 +86,7 @@ impl IrohNode {
 
     /// List all the docs we have access to on this node.
     pub fn doc_list(&self) -> Result<Vec<NamespaceAndCapability>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let docs = self
                 .sync_client
                 .docs()
@@ -108,7 +108,7 @@ impl IrohNode {
     /// Returns None if the document cannot be found.
     pub fn doc_open(&self, id: String) -> Result<Option<Arc<Doc>>, IrohError> {
         let namespace_id = iroh::docs::NamespaceId::from_str(&id)?;
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let doc = self.sync_client.docs().open(namespace_id).await?;
 
             Ok(doc.map(|d| {
@@ -127,7 +127,7 @@ impl IrohNode {
     /// through garbage collection unless they are referenced from another document or tag.
     pub fn doc_drop(&self, doc_id: String) -> Result<(), IrohError> {
         let doc_id = iroh::docs::NamespaceId::from_str(&doc_id)?;
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             self.sync_client
                 .docs()
                 .drop_doc(doc_id)
@@ -648,7 +648,7 @@ impl Entry {
     /// before calling [`Self::content_bytes`].
     pub fn content_bytes(&self, doc: Arc<Doc>) -> Result<Vec<u8>, IrohError> {
         block_on(&doc.rt, async {
-            let res = self.0.content_bytes(&doc.inner).await.map(|c| c.to_vec())?;
+            let res = self.0.content_bytes(&doc.inner).await.map(Vec::from)?;
             Ok(res)
         })
     }
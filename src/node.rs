@@ -227,14 +227,13 @@ pub struct IrohNode {
     pub(crate) sync_client: MemIroh,
     #[allow(dead_code)]
     pub(crate) tokio_rt: Option<tokio::runtime::Runtime>,
+    /// Handle to the runtime the node runs on, resolved once at construction.
+    pub(crate) rt: tokio::runtime::Handle,
 }
 
 impl IrohNode {
-    pub(crate) fn rt(&self) -> tokio::runtime::Handle {
-        match self.tokio_rt {
-            Some(ref rt) => rt.handle().clone(),
-            None => tokio::runtime::Handle::current(),
-        }
+    pub(crate) fn rt(&self) -> &tokio::runtime::Handle {
+        &self.rt
     }
 
     /// Create a new iroh node. The `path` param should be a directory where we can store or load
@@ -270,11 +269,16 @@ impl IrohNode {
         let builder: Builder<iroh::blobs::store::mem::Store> = options.into();
         let node = builder.persist(path).await?.spawn().await?;
         let sync_client = node.clone().client().clone();
+        let rt = match tokio_rt {
+            Some(ref rt) => rt.handle().clone(),
+            None => tokio::runtime::Handle::current(),
+        };
 
         Ok(IrohNode {
             node,
             sync_client,
             tokio_rt,
+            rt,
         })
     }
 
@@ -285,7 +289,7 @@ impl IrohNode {
 
     /// Get statistics of the running node.
     pub fn stats(&self) -> Result<HashMap<String, CounterStats>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let stats = self.sync_client.stats().await?;
             Ok(stats
                 .into_iter()
@@ -304,7 +308,7 @@ impl IrohNode {
 
     /// Return `ConnectionInfo`s for each connection we have to another iroh node.
     pub fn connections(&self) -> Result<Vec<ConnectionInfo>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let infos = self
                 .sync_client
                 .connections()
@@ -321,7 +325,7 @@ impl IrohNode {
         &self,
         node_id: &PublicKey,
     ) -> Result<Option<ConnectionInfo>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let info = self
                 .sync_client
                 .connection_info(node_id.into())
@@ -333,7 +337,7 @@ impl IrohNode {
 
     /// Get status information about a node
     pub fn status(&self) -> Result<Arc<NodeStatus>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let res = self
                 .sync_client
                 .status()
@@ -17,7 +17,7 @@ pub struct TagInfo {
 impl From<iroh::client::tags::TagInfo> for TagInfo {
     fn from(res: iroh::client::tags::TagInfo) -> Self {
         TagInfo {
-            name: res.name.0.to_vec(),
+            name: Vec::from(res.name.0),
             format: res.format.into(),
             hash: Arc::new(res.hash.into()),
         }
@@ -30,7 +30,7 @@ impl IrohNode {
     /// Note: this allocates for each `ListTagsResponse`, if you have many `Tags`s this may be a prohibitively large list.
     /// Please file an [issue](https://github.com/n0-computer/iroh-ffi/issues/new) if you run into this issue
     pub fn tags_list(&self) -> Result<Vec<TagInfo>, IrohError> {
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             let tags = self
                 .sync_client
                 .tags()
@@ -46,7 +46,7 @@ impl IrohNode {
     /// Delete a tag
     pub fn tags_delete(&self, name: Vec<u8>) -> Result<(), IrohError> {
         let tag = iroh::blobs::Tag(Bytes::from(name));
-        block_on(&self.rt(), async {
+        block_on(self.rt(), async {
             self.sync_client.tags().delete(tag).await?;
             Ok(())
         })